@@ -4,207 +4,504 @@ SRAM Compilation Script
 Automates the SRAM generation process with various configurations
 """
 
+from __future__ import annotations
+
 import os
 import sys
 import json
 import argparse
+import atexit
+import functools
+import hashlib
+import math
+import mmap
+import shutil
+from collections import Counter
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if TYPE_CHECKING:
+    from compiler.sram_compiler import SRAMCompiler
+
+# Source directory of the compiler package
+SRC_DIR = Path(__file__).parent.parent / 'src'
+
+# Predefined configuration templates
+CONFIG_TEMPLATES = Path(__file__).parent.parent / 'config' / 'sram_configs.json'
+
+# Activity factors swept by the power analysis
+ACTIVITY_FACTORS = (0.01, 0.05, 0.1, 0.2, 0.5)
+
+# Below this many distinct configurations, worker start-up outweighs running in parallel
+PARALLEL_MIN_CONFIGS = 8
+
+# JSON files above this size are memory-mapped instead of read into memory
+MMAP_THRESHOLD = 1 << 20
+
+def _get_compiler_cls():
+    """Import SRAMCompiler on first use so the list command stays lightweight"""
+    if str(SRC_DIR) not in sys.path:
+        sys.path.append(str(SRC_DIR))
+    from compiler.sram_compiler import SRAMCompiler
+    return SRAMCompiler
+
+# JSON output follows the stdlib encoder: inf/NaN are written as Infinity/NaN
+# and non-ASCII text as raw UTF-8. orjson is only used where it produces the
+# same document.
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+def _is_finite_json(obj) -> bool:
+    """Check that an object holds no inf/NaN, which orjson would write as null"""
+    if isinstance(obj, float):
+        return math.isfinite(obj)
+    if isinstance(obj, dict):
+        return all(map(_is_finite_json, obj.values()))
+    if isinstance(obj, (list, tuple)):
+        return all(map(_is_finite_json, obj))
+    return True
+
+def _loads(data):
+    """Parse JSON bytes, using orjson when available"""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects the Infinity/NaN literals the stdlib encoder writes
+            pass
+    return json.loads(bytes(data))
+
+def _read_json(path: Path):
+    """Read a JSON file, using orjson when available"""
+    if orjson is not None and path.stat().st_size > MMAP_THRESHOLD:
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return _loads(view)
+    return _loads(path.read_bytes())
 
-# Add src directory to path
-sys.path.append(str(Path(__file__).parent.parent / 'src'))
+def _encode_json(obj) -> bytes:
+    """Encode an object as indented JSON, using orjson when available"""
+    if orjson is not None and _is_finite_json(obj):
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS | orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode()
 
-from compiler.sram_compiler import SRAMCompiler
+def _encode_json_line(obj) -> bytes:
+    """Encode an object as a single newline-terminated JSON line"""
+    if orjson is not None and _is_finite_json(obj):
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS | orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode() + b"\n"
+
+def _iter_ndjson(path: Path):
+    """Yield the records of an NDJSON file one at a time"""
+    with open(path, 'rb') as f:
+        for line in f:
+            if line.strip():
+                yield _loads(line)
+
+def _ndjson_to_json_array(ndjson_path: Path, json_path: Path):
+    """Rewrite an NDJSON file as an indented JSON array, one record at a time"""
+    with open(json_path, 'wb') as f:
+        separator = b"[\n"
+        for record in _iter_ndjson(ndjson_path):
+            f.write(separator)
+            f.write(b"  " + _encode_json(record).replace(b"\n", b"\n  "))
+            separator = b",\n"
+        f.write(b"\n]" if separator == b",\n" else b"[]")
+
+def _write_json(path: Path, obj):
+    """Write an object as indented JSON"""
+    path.write_bytes(_encode_json(obj))
+
+def _file_matches(path: Path, data: bytes) -> bool:
+    """Check whether a file already holds exactly the given bytes"""
+    try:
+        return path.stat().st_size == len(data) and path.read_bytes() == data
+    except FileNotFoundError:
+        return False
+
+class OutputSink:
+    """Buffers report files in memory and writes them out in one pass"""
+    
+    def __init__(self, output_dir: str):
+        self.root = Path(output_dir)
+        self._files = {}
+    
+    def write_bytes(self, name: str, data: bytes, label: str = None):
+        """Queue raw bytes for <output_dir>/<name>, announced as <label> once written"""
+        self._files[name] = (data, label)
+    
+    def write_text(self, name: str, text: str, label: str = None):
+        """Queue UTF-8 text for <output_dir>/<name>"""
+        self.write_bytes(name, text.encode('utf-8'), label)
+    
+    def write_json(self, name: str, obj, label: str = None):
+        """Queue an object as indented JSON for <output_dir>/<name>"""
+        self.write_bytes(name, _encode_json(obj), label)
+    
+    def flush(self):
+        """Write all queued files to disk"""
+        for name, (data, label) in self._files.items():
+            path = self.root / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(data)
+            if label:
+                print(f"{label} saved to: {path}")
+        self._files.clear()
+
+@functools.lru_cache(maxsize=1)
+def _load_configs() -> dict:
+    """Load and cache the configuration templates"""
+    return _read_json(CONFIG_TEMPLATES)
+
+# Estimate results keyed by configuration hash, persisted in the output directory
+_ESTIMATE_CACHE = {}
+_ESTIMATE_CACHE_FILE = None
+_ESTIMATE_CACHE_FINGERPRINT = None
+_ESTIMATE_CACHE_DIRTY = False
+
+def _compiler_fingerprint() -> str:
+    """Fingerprint the estimator inputs so persisted estimates expire when they change"""
+    compiler_cls = _get_compiler_cls()
+    package_dir = Path(sys.modules[compiler_cls.__module__].__file__).parent
+    
+    digest = hashlib.sha1(str(getattr(compiler_cls, '__version__', '')).encode())
+    
+    # Template-level tables (technology_nodes, power_optimization_levels) feed the
+    # estimators without being part of the per-configuration hash
+    if CONFIG_TEMPLATES.exists():
+        digest.update(CONFIG_TEMPLATES.read_bytes())
+    
+    sources = sorted(path for path in package_dir.rglob('*')
+                     if path.is_file() and '__pycache__' not in path.parts)
+    for source in sources:
+        digest.update(source.relative_to(package_dir).as_posix().encode())
+        digest.update(source.read_bytes())
+    return digest.hexdigest()
+
+def _init_estimate_cache(output_dir: str):
+    """Load previously persisted estimates and save them again at exit"""
+    global _ESTIMATE_CACHE_FILE, _ESTIMATE_CACHE_FINGERPRINT
+    if _ESTIMATE_CACHE_FILE is not None:
+        return
+    
+    _ESTIMATE_CACHE_FILE = Path(output_dir) / ".estimate_cache.json"
+    _ESTIMATE_CACHE_FINGERPRINT = _compiler_fingerprint()
+    if _ESTIMATE_CACHE_FILE.exists():
+        try:
+            cached = _read_json(_ESTIMATE_CACHE_FILE)
+        except ValueError:
+            cached = None
+        
+        if not (isinstance(cached, dict) and isinstance(cached.get("estimates"), dict)):
+            print(f"Ignoring corrupt estimate cache: {_ESTIMATE_CACHE_FILE}")
+        elif cached.get("fingerprint") == _ESTIMATE_CACHE_FINGERPRINT:
+            _ESTIMATE_CACHE.update(cached["estimates"])
+    atexit.register(_save_estimate_cache)
 
-def create_config_file(config_name: str, output_dir: str) -> str:
+def _cache_estimates(estimates: dict):
+    """Add new estimates to the cache and mark it for saving"""
+    global _ESTIMATE_CACHE_DIRTY
+    if estimates:
+        _ESTIMATE_CACHE.update(estimates)
+        _ESTIMATE_CACHE_DIRTY = True
+
+def _save_estimate_cache():
+    """Persist the estimate cache if anything was added this run"""
+    if _ESTIMATE_CACHE_DIRTY and _ESTIMATE_CACHE_FILE.parent.is_dir():
+        _write_json(_ESTIMATE_CACHE_FILE, {
+            "fingerprint": _ESTIMATE_CACHE_FINGERPRINT,
+            "estimates": _ESTIMATE_CACHE
+        })
+
+def _config_dict(config) -> dict:
+    """Return a detached dict copy of an SRAM configuration"""
+    import dataclasses
+    if dataclasses.is_dataclass(config):
+        return dataclasses.asdict(config)
+    return dict(vars(config))
+
+def _config_hash(compiler: SRAMCompiler) -> str:
+    """Hash the compiler configuration for use in estimate cache keys"""
+    config_json = json.dumps(_config_dict(compiler.config), sort_keys=True, default=str)
+    return hashlib.sha1(config_json.encode()).hexdigest()
+
+def _estimate_key(config_hash: str, kind: str, *args) -> str:
+    """Build the estimate cache key for one estimator call"""
+    return f"{config_hash}:{kind}:{','.join(map(repr, args))}"
+
+def _estimate(compiler: SRAMCompiler, kind: str, *args):
+    """Run compiler.estimate_<kind>(*args), memoized on the configuration"""
+    key = _estimate_key(_config_hash(compiler), kind, *args)
+    
+    if key not in _ESTIMATE_CACHE:
+        _cache_estimates({key: getattr(compiler, f"estimate_{kind}")(*args)})
+    return _ESTIMATE_CACHE[key]
+
+def _estimate_all(compiler: SRAMCompiler, kinds=("power", "area", "timing")) -> dict:
+    """Run the memoized estimators for several metrics"""
+    return {kind: _estimate(compiler, kind) for kind in kinds}
+
+def create_config_file(config_name: str, output_path: Path) -> str:
     """Create a configuration file from predefined templates"""
     
     # Load configuration templates
-    config_file = Path(__file__).parent.parent / 'config' / 'sram_configs.json'
-    
-    if not config_file.exists():
-        print(f"Configuration file not found: {config_file}")
+    if not CONFIG_TEMPLATES.exists():
+        print(f"Configuration file not found: {CONFIG_TEMPLATES}")
         return None
     
-    with open(config_file, 'r') as f:
-        configs = json.load(f)
+    configs = _load_configs()
     
     if config_name not in configs['example_configs']:
         print(f"Configuration '{config_name}' not found in templates")
         print(f"Available configurations: {list(configs['example_configs'].keys())}")
         return None
     
-    # Create output configuration file
-    output_config = Path(output_dir) / f"{config_name}_config.json"
-    output_config.parent.mkdir(parents=True, exist_ok=True)
+    # Create output configuration file (output_path must already exist)
+    output_config = output_path / f"{config_name}_config.json"
+    config_bytes = _encode_json(configs['example_configs'][config_name])
     
-    with open(output_config, 'w') as f:
-        json.dump(configs['example_configs'][config_name], f, indent=2)
+    # Leave an identical file untouched instead of rewriting it on every run
+    if not _file_matches(output_config, config_bytes):
+        output_config.write_bytes(config_bytes)
     
     return str(output_config)
 
-def run_power_analysis(compiler: SRAMCompiler, output_dir: str):
+def _stage_config(src: str, output_path: Path) -> str:
+    """Copy a user-supplied configuration file into the output directory"""
+    # Same naming as create_config_file, so it cannot collide with report outputs
+    staged_config = output_path / f"{Path(src).stem.removesuffix('_config')}_config.json"
+    
+    if not os.path.exists(src):
+        print(f"Configuration file not found: {src}")
+        return None
+    
+    # copyfile uses the kernel's zero-copy path (sendfile) where available
+    if not (staged_config.exists() and os.path.samefile(src, staged_config)):
+        shutil.copyfile(src, staged_config)
+    
+    return str(staged_config)
+
+def run_power_analysis(compiler: SRAMCompiler, sink: OutputSink):
     """Run comprehensive power analysis"""
     print("Running power analysis...")
     
     # Analyze different activity factors
-    activity_factors = [0.01, 0.05, 0.1, 0.2, 0.5]
-    results = {}
-    
-    for activity in activity_factors:
-        power_est = compiler.estimate_power(activity)
-        results[f"activity_{activity}"] = power_est
+    results = {f"activity_{activity}": _estimate(compiler, "power", activity)
+               for activity in ACTIVITY_FACTORS}
     
     # Save power analysis results
-    power_file = Path(output_dir) / "power_analysis.json"
-    with open(power_file, 'w') as f:
-        json.dump(results, f, indent=2)
-    
-    print(f"Power analysis saved to: {power_file}")
+    sink.write_json("power_analysis.json", results, label="Power analysis")
 
-def run_area_analysis(compiler: SRAMCompiler, output_dir: str):
+def run_area_analysis(compiler: SRAMCompiler, sink: OutputSink):
     """Run area analysis"""
     print("Running area analysis...")
     
-    area_est = compiler.estimate_area()
-    timing_est = compiler.estimate_timing()
-    
-    analysis = {
-        "area": area_est,
-        "timing": timing_est
-    }
+    analysis = _estimate_all(compiler, ("area", "timing"))
     
     # Save analysis results
-    analysis_file = Path(output_dir) / "area_timing_analysis.json"
-    with open(analysis_file, 'w') as f:
-        json.dump(analysis, f, indent=2)
+    sink.write_json("area_timing_analysis.json", analysis, label="Area and timing analysis")
+
+def _init_worker(estimate_cache: dict):
+    """Seed a worker process with the parent's estimate cache"""
+    _ESTIMATE_CACHE.update(estimate_cache)
+
+def _compile_one(config_name: str, config_file: str):
+    """Compile and estimate a single configuration for the comparison report"""
+    compiler = _get_compiler_cls()(config_file)
+    
+    return {
+        "config_name": config_name,
+        "configuration": _config_dict(compiler.config),
+        **_estimate_all(compiler)
+    }
+
+def _compile_one_in_worker(config_name: str, config_file: str):
+    """Compile one configuration in a pool worker, returning any new estimates too"""
+    known = set(_ESTIMATE_CACHE)
+    record = _compile_one(config_name, config_file)
+    
+    # Hand new estimates back so the parent can persist them
+    new_estimates = {k: v for k, v in _ESTIMATE_CACHE.items() if k not in known}
+    return record, new_estimates
+
+def _compile_all(config_names: list, config_files: list):
+    """Yield the record for each configuration, in the order given"""
+    if len(config_files) < PARALLEL_MIN_CONFIGS:
+        yield from map(_compile_one, config_names, config_files)
+        return
     
-    print(f"Area and timing analysis saved to: {analysis_file}")
+    from concurrent.futures import ProcessPoolExecutor
+    max_workers = min(len(config_files), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                             initargs=(_ESTIMATE_CACHE,)) as executor:
+        for record, new_estimates in executor.map(_compile_one_in_worker, config_names, config_files):
+            _cache_estimates(new_estimates)
+            yield record
+
+def _fan_out(records, config_names: list):
+    """Repeat each distinct record for every time its configuration was requested"""
+    records = iter(records)
+    remaining = Counter(config_names)
+    pending = {}
+    
+    for config_name in config_names:
+        # Records arrive in first-request order, so a name not seen yet is next
+        record = pending.pop(config_name, None) or next(records)
+        remaining[config_name] -= 1
+        if remaining[config_name]:
+            pending[config_name] = record
+        yield record
 
-def generate_comparison_report(configs: list, output_dir: str):
+def _stream_records(compiled, f):
+    """Append each compiled record to an NDJSON file and pass it on"""
+    for record in compiled:
+        f.write(_encode_json_line(record))
+        yield record
+
+def generate_comparison_report(configs: list, sink: OutputSink):
     """Generate comparison report for multiple configurations"""
     print("Generating comparison report...")
     
-    comparison_data = []
-    
-    for config_name in configs:
-        config_file = create_config_file(config_name, output_dir)
-        if not config_file:
-            continue
-            
-        compiler = SRAMCompiler(config_file)
-        
-        power_est = compiler.estimate_power()
-        area_est = compiler.estimate_area()
-        timing_est = compiler.estimate_timing()
-        
-        comparison_data.append({
-            "config_name": config_name,
-            "configuration": compiler.config.__dict__,
-            "power": power_est,
-            "area": area_est,
-            "timing": timing_est
-        })
-    
-    # Save comparison report
-    comparison_file = Path(output_dir) / "comparison_report.json"
-    with open(comparison_file, 'w') as f:
-        json.dump(comparison_data, f, indent=2)
-    
-    # Generate markdown report
-    generate_markdown_comparison(comparison_data, output_dir)
-    
-    print(f"Comparison report saved to: {comparison_file}")
+    # Write each config file once, up front, so workers only ever read them
+    config_files = {}
+    for config_name in dict.fromkeys(configs):
+        config_file = create_config_file(config_name, sink.root)
+        if config_file:
+            config_files[config_name] = config_file
+    
+    config_names = [config_name for config_name in configs if config_name in config_files]
+    
+    # Stream each record to disk as soon as it is available, in request order,
+    # formatting its markdown rows from the live record on the way through.
+    # The NDJSON file is the only copy of the records kept.
+    ndjson_file = sink.root / "comparison_report.ndjson"
+    with open(ndjson_file, 'wb', buffering=1 << 20) as f:
+        # Compile each distinct configuration once, then repeat it as requested
+        compiled = _fan_out(_compile_all(list(config_files), list(config_files.values())),
+                            config_names)
+        generate_markdown_comparison(_stream_records(compiled, f), sink)
+    
+    # Save comparison report as a single JSON array for existing consumers
+    comparison_file = sink.root / "comparison_report.json"
+    _ndjson_to_json_array(ndjson_file, comparison_file)
+    
+    print(f"Comparison report saved to: {ndjson_file} and {comparison_file}")
 
-def generate_markdown_comparison(data: list, output_dir: str):
-    """Generate markdown comparison report"""
+# Row formatters for the markdown comparison tables
+_CONFIG_ROW = "| {name} | {depth} | {width} | {banks} | {voltage}V | {process_node}nm | {features} |\n".format_map
+_POWER_ROW = "| {name} | {dynamic:.3f} | {static:.3f} | {total:.3f} | {retention:.1f} |\n".format_map
+_AREA_ROW = "| {name} | {area:.4f} | {efficiency:.1f} | {access:.2f} | {fmax:.1f} |\n".format_map
+
+# Power features and their abbreviations in the configuration table
+_FEATURE_TAGS = (
+    ('power_gating', 'PG'),
+    ('clock_gating', 'CG'),
+    ('retention_mode', 'RET'),
+    ('ecc_enable', 'ECC')
+)
+
+def generate_markdown_comparison(records, sink: OutputSink):
+    """Generate markdown comparison report in a single pass over the records"""
     
-    md_content = "# SRAM Configuration Comparison Report\n\n"
+    config_rows = []
+    power_rows = []
+    area_rows = []
+    features_join = ', '.join
     
-    # Configuration table
-    md_content += "## Configuration Summary\n\n"
-    md_content += "| Config | Depth | Width | Banks | Voltage | Process | Power Features |\n"
-    md_content += "|--------|-------|-------|-------|---------|---------|----------------|\n"
-    
-    for item in data:
+    for item in records:
+        name = item['config_name']
         config = item['configuration']
-        features = []
-        if config['power_gating']: features.append('PG')
-        if config['clock_gating']: features.append('CG')
-        if config['retention_mode']: features.append('RET')
-        if config['ecc_enable']: features.append('ECC')
+        power = item['power']
+        area = item['area']
+        timing = item['timing']
         
-        md_content += f"| {item['config_name']} | {config['depth']} | {config['width']} | {config['banks']} | {config['voltage']}V | {config['process_node']}nm | {', '.join(features)} |\n"
+        config_rows.append(_CONFIG_ROW({
+            'name': name,
+            'depth': config['depth'],
+            'width': config['width'],
+            'banks': config['banks'],
+            'voltage': config['voltage'],
+            'process_node': config['process_node'],
+            'features': features_join([tag for key, tag in _FEATURE_TAGS if config[key]])
+        }))
+        power_rows.append(_POWER_ROW({
+            'name': name,
+            'dynamic': power['dynamic_power_mw'],
+            'static': power['static_power_mw'],
+            'total': power['total_power_mw'],
+            'retention': power['retention_power_uw']
+        }))
+        area_rows.append(_AREA_ROW({
+            'name': name,
+            'area': area['total_area_mm2'],
+            'efficiency': area['area_efficiency'] * 100,
+            'access': timing['access_time_ns'],
+            'fmax': timing['max_frequency_mhz']
+        }))
+    
+    parts = ["# SRAM Configuration Comparison Report\n\n"]
     
-    # Power comparison
-    md_content += "\n## Power Comparison\n\n"
-    md_content += "| Config | Dynamic Power (mW) | Static Power (mW) | Total Power (mW) | Retention Power (µW) |\n"
-    md_content += "|--------|-------------------|------------------|------------------|--------------------|\n"
+    # Configuration table
+    parts.append("## Configuration Summary\n\n")
+    parts.append("| Config | Depth | Width | Banks | Voltage | Process | Power Features |\n")
+    parts.append("|--------|-------|-------|-------|---------|---------|----------------|\n")
+    parts.extend(config_rows)
     
-    for item in data:
-        power = item['power']
-        md_content += f"| {item['config_name']} | {power['dynamic_power_mw']:.3f} | {power['static_power_mw']:.3f} | {power['total_power_mw']:.3f} | {power['retention_power_uw']:.1f} |\n"
+    # Power comparison
+    parts.append("\n## Power Comparison\n\n")
+    parts.append("| Config | Dynamic Power (mW) | Static Power (mW) | Total Power (mW) | Retention Power (µW) |\n")
+    parts.append("|--------|-------------------|------------------|------------------|--------------------|\n")
+    parts.extend(power_rows)
     
     # Area comparison
-    md_content += "\n## Area Comparison\n\n"
-    md_content += "| Config | Total Area (mm²) | Area Efficiency (%) | Access Time (ns) | Max Frequency (MHz) |\n"
-    md_content += "|--------|------------------|-------------------|------------------|--------------------|\n"
-    
-    for item in data:
-        area = item['area']
-        timing = item['timing']
-        md_content += f"| {item['config_name']} | {area['total_area_mm2']:.4f} | {area['area_efficiency']*100:.1f} | {timing['access_time_ns']:.2f} | {timing['max_frequency_mhz']:.1f} |\n"
+    parts.append("\n## Area Comparison\n\n")
+    parts.append("| Config | Total Area (mm²) | Area Efficiency (%) | Access Time (ns) | Max Frequency (MHz) |\n")
+    parts.append("|--------|------------------|-------------------|------------------|--------------------|\n")
+    parts.extend(area_rows)
     
     # Save markdown report
-    md_file = Path(output_dir) / "comparison_report.md"
-    with open(md_file, 'w') as f:
-        f.write(md_content)
+    sink.write_text("comparison_report.md", "".join(parts))
 
-def main():
-    parser = argparse.ArgumentParser(description='SRAM Compiler Script')
-    parser.add_argument('--config', help='Configuration name or file path')
-    parser.add_argument('--output', default='output', help='Output directory')
-    parser.add_argument('--generate-verilog', action='store_true', help='Generate Verilog RTL')
-    parser.add_argument('--power-analysis', action='store_true', help='Run power analysis')
-    parser.add_argument('--area-analysis', action='store_true', help='Run area analysis')
-    parser.add_argument('--compare', nargs='+', help='Compare multiple configurations')
-    parser.add_argument('--list-configs', action='store_true', help='List available configurations')
-    
-    args = parser.parse_args()
-    
-    # Create output directory
-    output_dir = Path(args.output)
-    output_dir.mkdir(parents=True, exist_ok=True)
-    
-    # List available configurations
-    if args.list_configs:
-        config_file = Path(__file__).parent.parent / 'config' / 'sram_configs.json'
-        with open(config_file, 'r') as f:
-            configs = json.load(f)
-        print("Available configurations:")
-        for name, config in configs['example_configs'].items():
-            print(f"  {name}: {config['depth']}x{config['width']}, {config['banks']} banks, {config['process_node']}nm")
-        return
-    
-    # Compare multiple configurations
-    if args.compare:
-        generate_comparison_report(args.compare, args.output)
-        return
-    
-    # Single configuration processing
-    if not args.config:
-        print("Please specify a configuration with --config")
-        return
+def _prepare_output(args) -> OutputSink:
+    """Create the output directory and a sink for buffered results"""
+    Path(args.output).mkdir(parents=True, exist_ok=True)
+    _init_estimate_cache(args.output)
+    return OutputSink(args.output)
+
+def _cmd_list(args):
+    """List available configurations"""
+    configs = _load_configs()
+    sys.stdout.write("Available configurations:\n" + "".join(
+        f"  {name}: {config['depth']}x{config['width']}, {config['banks']} banks, {config['process_node']}nm\n"
+        for name, config in configs['example_configs'].items()
+    ))
+
+def _cmd_compare(args):
+    """Compare multiple configurations"""
+    sink = _prepare_output(args)
+    generate_comparison_report(args.configs, sink)
+    sink.flush()
+
+def _cmd_build(args):
+    """Compile a single configuration"""
+    sink = _prepare_output(args)
+    output_dir = sink.root
     
     # Create or use configuration file
     if args.config.endswith('.json'):
-        config_file = args.config
+        config_file = _stage_config(args.config, output_dir)
     else:
-        config_file = create_config_file(args.config, args.output)
-        if not config_file:
-            return
+        config_file = create_config_file(args.config, output_dir)
+    if not config_file:
+        return
     
     # Create compiler instance
-    compiler = SRAMCompiler(config_file)
+    compiler = _get_compiler_cls()(config_file)
     
     # Generate Verilog
     if args.generate_verilog:
@@ -213,17 +510,47 @@ def main():
     
     # Run power analysis
     if args.power_analysis:
-        run_power_analysis(compiler, args.output)
+        run_power_analysis(compiler, sink)
     
     # Run area analysis
     if args.area_analysis:
-        run_area_analysis(compiler, args.output)
+        run_area_analysis(compiler, sink)
+    
+    # Write out buffered analysis results before the design report can fail
+    sink.flush()
     
     # Generate design report
-    report_file = output_dir / f"{args.config}_report.md"
+    report_file = output_dir / f"{Path(args.config).stem}_report.md"
     compiler.generate_report(str(report_file))
     
     print(f"SRAM compilation completed. Output in: {output_dir}")
 
+_COMMANDS = {
+    'list': _cmd_list,
+    'compare': _cmd_compare,
+    'build': _cmd_build
+}
+
+def main():
+    parser = argparse.ArgumentParser(description='SRAM Compiler Script')
+    subparsers = parser.add_subparsers(dest='cmd', metavar='command', required=True)
+    
+    output_args = argparse.ArgumentParser(add_help=False)
+    output_args.add_argument('--output', default='output', help='Output directory')
+    
+    subparsers.add_parser('list', help='List available configurations')
+    
+    compare_parser = subparsers.add_parser('compare', parents=[output_args], help='Compare multiple configurations')
+    compare_parser.add_argument('configs', nargs='+', help='Configuration names')
+    
+    build_parser = subparsers.add_parser('build', parents=[output_args], help='Compile a single configuration')
+    build_parser.add_argument('config', help='Configuration name or file path')
+    build_parser.add_argument('--generate-verilog', action='store_true', help='Generate Verilog RTL')
+    build_parser.add_argument('--power-analysis', action='store_true', help='Run power analysis')
+    build_parser.add_argument('--area-analysis', action='store_true', help='Run area analysis')
+    
+    args = parser.parse_args()
+    _COMMANDS[args.cmd](args)
+
 if __name__ == "__main__":
     main()
@@ -48,7 +48,7 @@ help:
 compile:
 	@echo "Compiling SRAM with configuration: $(CONFIG)"
 	$(PYTHON) $(SCRIPTS_DIR)/compile_sram.py \
-		--config $(or $(CONFIG),$(DEFAULT_CONFIG)) \
+		build $(or $(CONFIG),$(DEFAULT_CONFIG)) \
 		--output $(OUTPUT_DIR)/$(or $(CONFIG),$(DEFAULT_CONFIG)) \
 		--generate-verilog
 
@@ -56,7 +56,7 @@ compile:
 analyze:
 	@echo "Running analysis for configuration: $(CONFIG)"
 	$(PYTHON) $(SCRIPTS_DIR)/compile_sram.py \
-		--config $(or $(CONFIG),$(DEFAULT_CONFIG)) \
+		build $(or $(CONFIG),$(DEFAULT_CONFIG)) \
 		--output $(OUTPUT_DIR)/$(or $(CONFIG),$(DEFAULT_CONFIG)) \
 		--power-analysis \
 		--area-analysis
@@ -68,12 +68,12 @@ full: compile analyze
 compare:
 	@echo "Comparing configurations: $(CONFIGS)"
 	$(PYTHON) $(SCRIPTS_DIR)/compile_sram.py \
-		--compare $(CONFIGS) \
+		compare $(CONFIGS) \
 		--output $(OUTPUT_DIR)/comparison
 
 # List available configurations
 list-configs:
-	$(PYTHON) $(SCRIPTS_DIR)/compile_sram.py --list-configs
+	$(PYTHON) $(SCRIPTS_DIR)/compile_sram.py list
 
 # Run verification
 verify:
@@ -96,7 +96,7 @@ docs:
 	@echo "This directory contains generated SRAM designs and analysis reports." >> $(OUTPUT_DIR)/docs/README.md
 	@echo "" >> $(OUTPUT_DIR)/docs/README.md
 	@echo "## Available Configurations" >> $(OUTPUT_DIR)/docs/README.md
-	@$(PYTHON) $(SCRIPTS_DIR)/compile_sram.py --list-configs >> $(OUTPUT_DIR)/docs/README.md
+	@$(PYTHON) $(SCRIPTS_DIR)/compile_sram.py list >> $(OUTPUT_DIR)/docs/README.md
 
 # Power analysis for all configurations
 power-sweep:
@@ -104,7 +104,7 @@ power-sweep:
 	@for config in small_cache large_memory ultra_low_power high_performance; do \
 		echo "Analyzing $$config..."; \
 		$(PYTHON) $(SCRIPTS_DIR)/compile_sram.py \
-			--config $$config \
+			build $$config \
 			--output $(OUTPUT_DIR)/$$config \
 			--power-analysis; \
 	done
@@ -115,7 +115,7 @@ area-sweep:
 	@for config in small_cache large_memory ultra_low_power high_performance; do \
 		echo "Analyzing $$config..."; \
 		$(PYTHON) $(SCRIPTS_DIR)/compile_sram.py \
-			--config $$config \
+			build $$config \
 			--output $(OUTPUT_DIR)/$$config \
 			--area-analysis; \
 	done
@@ -126,7 +126,7 @@ generate-all:
 	@for config in small_cache large_memory ultra_low_power high_performance; do \
 		echo "Generating $$config..."; \
 		$(PYTHON) $(SCRIPTS_DIR)/compile_sram.py \
-			--config $$config \
+			build $$config \
 			--output $(OUTPUT_DIR)/$$config \
 			--generate-verilog \
 			--power-analysis \